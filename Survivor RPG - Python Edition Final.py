@@ -8,31 +8,66 @@ you outwit, outplay, and outlast the other castaways, you are the Sole Survivor
 the winner of one million dollars!
 """
 
+import math
+import os
 import random
+import sys
 import time
-import json
-import os
-
-validTraits = [
-    "Extrovert", "Disarming", "Smart", "Confident", "Athletic",
-    "Resourceful", "Sneaky", "Sweet", "Charismatic", "Strategic",
-    "Cerebral", "Naive", "Unathletic", "Moody", "Insecure",
-    "Follower", "Delusionally Confident", "Self-Indulgent", "Jealous", "Blunt"
-]
+from collections import Counter
+from copy import copy
+from sys import intern
+from types import MappingProxyType
 
-# Attribute scores and flaw penalties
+# Attribute scores and flaw penalties (read-only so nothing can rebind them).
+# Trait names are interned so lookups with a character's traits, which are
+# interned too, match on identity.
 
-ATTRIBUTE_SCORES = {
+ATTRIBUTE_SCORES = MappingProxyType({intern(trait): score for trait, score in {
     "Extrovert": 5, "Disarming": 10, "Smart": 7, "Confident": 8,
-    "Athletic": 6, "Resourceful": 4, "Sneaky": 2, "Sweet": 3, "Charismatic": 9,
-    "Strategic": 5,
-}
+    "Athletic": 6, "Resourceful": 7, "Sneaky": 4, "Sweet": 5, "Charismatic": 9,
+    "Strategic": 5, "Patient": 6, "Resilient": 9
+}.items()})
 
-FLAW_PENALTIES = {
-    "Cerebral": -5, "Naive": -2, "Unathletic": -5, "Moody": -8,
+FLAW_PENALTIES = MappingProxyType({intern(flaw): penalty for flaw, penalty in {
+    "Cerebral": -4, "Naive": -2, "Unathletic": -5, "Moody": -6,
     "Insecure": -7, "Follower": -3, "Delusionally Confident": -6,
-    "Self-Indulgent": -4, "Jealous": -9, "Blunt": -10
-}
+    "Self-Indulgent": -5, "Jealous": -8, "Blunt": -10
+}.items()})
+
+# Any trait a character can be dealt is a valid Trait Challenge answer
+VALID_TRAITS = frozenset(ATTRIBUTE_SCORES).union(FLAW_PENALTIES)
+
+
+def normalizeAnswer(text):
+    """
+    Normalizes a typed answer so it can be compared with a stored answer.
+
+    @param text: str. The raw answer.
+
+    @return: str. The answer stripped of surrounding whitespace and casefolded.
+    """
+    return text.strip().casefold()
+
+# Challenge content as (prompt, answer) pairs, ready for random.choice.
+# Answers are normalized once here so each guess is a single comparison.
+
+RIDDLES = tuple((riddle, normalizeAnswer(answer)) for riddle, answer in (
+    ("I grant safety, but remain hidden unless found. What am I?", "idol"),
+    ("With fire and parchment, I speak for the tribe. What am I?", "tribal council"),
+    ("The more you win me, the longer you stay in the game. What am I?", "immunity")
+))
+
+PUZZLES = tuple((puzzle, normalizeAnswer(answer)) for puzzle, answer in (
+    ("There are three players left: Jerri, Rupert, and Cirie. Jerri and Rupert both voted for Cirie. Cirie didn't vote for Jerri. Who was eliminated?", "cirie"),
+    ("You find a Hidden Immunity Idol. Do you play it before or after the votes are read?", "before"),
+    ("On an island, I help you live / boil me first before I give", "water")
+))
+
+PHRASES = tuple((normalizeAnswer(phrase), anagram) for phrase, anagram in (
+    ("fire represents life", "perresents file rife"),
+    ("the tribe has spoken", "sah nopesk brite the"),
+    ("final three", "treeh nifla")
+))
 
 
 #CHALLENGE CLASS
@@ -56,29 +91,31 @@ class Challenge:
 
          @param player: Character. The player participating in the challenge.
          @param success: bool. Indicates whether the player won the challenge.
+
+         @return: bool. The same `success` value, so challenges can return it.
         """
         if success:
             print("\n🎉 You WIN the challenge!")
-            player.modifySocialStatus(25)
-            player.modifyHealth(25)
+            player.applyOutcome(25, 25)
         else:
             print("\n❌ You LOST the challenge.")
-            player.modifySocialStatus(-10)
-            player.modifyHealth(-10)
+            player.applyOutcome(-10, -10)
 
         print(f"🏥 Current Health: {player.currentHealth}/{player.maxHealth}")
         print(f"📊 Social Status: {player.socialStatus}\n")
+        return success
 
     def checkTimer(self, startTime, limit=30):
         """
         Checks whether the challenge response time is within the allowed limit.
 
-        @param startTime: float. The starting time of the challenge.
+        @param startTime: float. The starting time of the challenge, as
+                          returned by `time.monotonic()`.
         @param limit: int. Optional. Default is 30 seconds. Maximum time allowed.
 
         @return: bool. True if within time, False otherwise.
         """
-        return (time.time() - startTime) <= limit
+        return (time.monotonic() - startTime) <= limit
 
 
 #Trait Challenge SubClass
@@ -101,26 +138,21 @@ class TraitChallenge(Challenge):
         print("You must name one attribute or flaw of any character in the game!")
         print("⏳ You have 30 seconds to enter a valid response.")
 
-        startTime = time.time()
+        startTime = time.monotonic()
         userInput = input("\n💡 Enter an attribute or flaw: ").strip().title()
-        endTime = time.time()
+        endTime = time.monotonic()
 
         if endTime - startTime > 30:
             print("\n⏰ Time's up! You failed to respond in time.")
-            player.modifySocialStatus(-10)
-            player.modifyHealth(-10)
-            return False
+            return self.handleResult(player, success=False)
 
-        if userInput in validTraits:
+        # An empty answer is wrong without hashing it
+        if userInput and userInput in VALID_TRAITS:
             print(f"\n✅ Correct! {userInput} is a valid trait.")
-            player.modifySocialStatus(25)
-            player.modifyHealth(25)
-            return True
+            return self.handleResult(player, success=True)
         else:
             print(f"\n❌ Incorrect! {userInput} is not a valid trait.")
-            player.modifySocialStatus(-10)
-            player.modifyHealth(-10)
-            return False
+            return self.handleResult(player, success=False)
 
 #Memory Challenge Subclass
 class TribeMemoryChallenge(Challenge):
@@ -135,11 +167,11 @@ class TribeMemoryChallenge(Challenge):
          Prompts the player to input tribe mates' names in alphabetical order.
 
          @param player: Character. The player attempting the challenge.
-         @param tribeMates: list. List of Enemy tribe mates.
+         @param tribeMates: TribeState. The current tribe mates.
 
          @return: bool. True if order is correct, False otherwise.
         """
-        correctOrder = sorted([mate.name for mate in tribeMates])
+        correctOrder = tribeMates.sortedNames
         scrambledNames = random.sample(correctOrder,
                                        len(correctOrder))  # randomize display order
 
@@ -147,20 +179,17 @@ class TribeMemoryChallenge(Challenge):
         print("List your tribe mates in **alphabetical order**, separated by commas.")
         print(f"🌿 Your current tribe mates: {', '.join(scrambledNames)}")
 
-        userInput = input("\n💡 Enter tribe mates in alphabetical order: ").strip().lower()
-        userList = [name.strip().title() for name in userInput.split(",") if name.strip()]
+        userInput = input("\n💡 Enter tribe mates in alphabetical order: ")
+        userList = tuple(name.strip().title() for name in userInput.split(",")
+                         if name.strip())
 
         if userList == correctOrder:
             print("\n✅ Correct! You placed your tribe mates' names in perfect order!")
-            player.modifySocialStatus(25)
-            player.modifyHealth(25)
-            return True
+            return self.handleResult(player, success=True)
         else:
             print("\n❌ Incorrect order!")
             print(f"📜 The correct order was: {', '.join(correctOrder)}")
-            player.modifySocialStatus(-10)
-            player.modifyHealth(-10)
-            return False
+            return self.handleResult(player, success=False)
 
 #Number Challenge Subclass
 class NumberGuessChallenge(Challenge):
@@ -189,20 +218,14 @@ class NumberGuessChallenge(Challenge):
             userGuess = int(input("\n💡 Enter your guess: ").strip())
         except ValueError:
             print("\n❌ Invalid input! You must enter a number.")
-            player.modifySocialStatus(-10)
-            player.modifyHealth(-10)
-            return False
+            return self.handleResult(player, success=False)
 
         if userGuess == correctNumber:
             print(f"\n✅ Correct! The number was {correctNumber}.")
-            player.modifySocialStatus(25)
-            player.modifyHealth(25)
-            return True
+            return self.handleResult(player, success=True)
         else:
             print(f"\n❌ Incorrect! The number was {correctNumber}.")
-            player.modifySocialStatus(-10)
-            player.modifyHealth(-10)
-            return False
+            return self.handleResult(player, success=False)
 
 #Riddle Challenge SubClass
 class RiddleChallenge(Challenge):
@@ -222,33 +245,24 @@ class RiddleChallenge(Challenge):
 
         @return: bool. True if the riddle is answered correctly, False otherwise.
         """
-        riddles = {
-            "I grant safety, but remain hidden unless found. What am I?": "idol",
-            "With fire and parchment, I speak for the tribe. What am I?": "tribal council",
-            "The more you win me, the longer you stay in the game. What am I?": "immunity"
-        }
-
-        riddle, answer = random.choice(list(riddles.items()))
+        riddle, answer = random.choice(RIDDLES)
         print("\n🧠 **Survivor Riddle Challenge!**")
         print(f"❓ **Riddle:** {riddle}")
 
-        startTime = time.time()
-        userGuess = input("\n💡 Enter your answer: ").strip().lower()
+        startTime = time.monotonic()
+        userGuess = normalizeAnswer(input("\n💡 Enter your answer: "))
 
         if not self.checkTimer(startTime):
             print("\n⏰ Time's up! You failed to respond in time.")
             return self.handleResult(player, success=False)
 
-        if userGuess == answer:
+        # An empty answer is wrong without comparing it
+        if userGuess and userGuess == answer:
             print("\n✅ Correct! You solved the riddle.")
-            player.modifySocialStatus(25)
-            player.modifyHealth(25)
-            return True
+            return self.handleResult(player, success=True)
         else:
             print(f"\n❌ Incorrect. The correct answer was: {answer}.")
-            player.modifySocialStatus(-10)
-            player.modifyHealth(-10)
-            return False
+            return self.handleResult(player, success=False)
 
 #Logic Challenge SubClass
 class LogicChallenge(Challenge):
@@ -268,29 +282,20 @@ class LogicChallenge(Challenge):
 
         @return: bool. True if correct, False otherwise.
         """
-        puzzles = {
-            "There are three players left: Jerri, Rupert, and Cirie. Jerri and Rupert both voted for Cirie. Cirie didn't vote for Jerri. Who was eliminated?": "cirie",
-            "You find a Hidden Immunity Idol. Do you play it before or after the votes are read?": "before",
-            "On an island, I help you live / boil me first before I give": "water"
-        }
-
-        puzzle, answer = random.choice(list(puzzles.items()))
+        puzzle, answer = random.choice(PUZZLES)
 
         print("\n🧩 Logic Challenge!")
         print(f"❓ Puzzle: {puzzle}")
 
-        userGuess = input("\n💡 Enter your answer: ").strip().lower()
+        userGuess = normalizeAnswer(input("\n💡 Enter your answer: "))
 
-        if userGuess == answer:
+        # An empty answer is wrong without comparing it
+        if userGuess and userGuess == answer:
             print("\n✅ Correct! You solved the puzzle.")
-            player.modifySocialStatus(25)
-            player.modifyHealth(25)
-            return True
+            return self.handleResult(player, success=True)
         else:
             print(f"\n❌ Incorrect! The correct answer was: {answer}.")
-            player.modifySocialStatus(-10)
-            player.modifyHealth(-10)
-            return False
+            return self.handleResult(player, success=False)
 
 #Anagram Challenge Sub Class
 class AnagramChallenge(Challenge):
@@ -310,80 +315,69 @@ class AnagramChallenge(Challenge):
 
        @return: bool. True if anagram is solved, False otherwise.
        """
-        phrases = {
-            "fire represents life": "perresents file rife",
-            "the tribe has spoken": "sah nopesk brite the",
-            "final three": "treeh nifla"
-        }
-
-        phrase, anagram = random.choice(list(phrases.items()))
+        phrase, anagram = random.choice(PHRASES)
 
         print("\n🔀 Anagram Challenge!")
         print(f"🔄 Unscramble this Survivor phrase: {anagram}")
 
-        userInput = input("\n💡 Enter the correct phrase: ").strip().lower()
+        userInput = normalizeAnswer(input("\n💡 Enter the correct phrase: "))
 
-        if userInput == phrase.lower():
+        # An empty answer is wrong without comparing it
+        if userInput and userInput == phrase:
             print("\n✅ Correct! You solved the anagram.")
-            player.modifySocialStatus(25)
-            player.modifyHealth(25)
-            return True
+            return self.handleResult(player, success=True)
         else:
             print(f"\n❌ Incorrect! The correct phrase was: {phrase}.")
-            player.modifySocialStatus(-10)
-            player.modifyHealth(-10)
-            return False
+            return self.handleResult(player, success=False)
+
+CHALLENGE_CLASSES = (
+    TraitChallenge,
+    TribeMemoryChallenge,
+    NumberGuessChallenge,
+    RiddleChallenge,
+    LogicChallenge,
+    AnagramChallenge
+)
 
-def dailyChallenge(player, tribeMates):
+def dailyChallenge(player, tribeMates, rng=None):
     """
     Launches a challenge where the player competes against tribe mates to gain
     immunity. Tribal Council is automatically triggered after the challenge.
 
     Parameters:
         player (Hero): The player's character.
-        tribeMates (list): List of Enemy objects representing the current tribe.
+        tribeMates (TribeState): The Enemy objects in the current tribe.
+        rng (random.Random): Optional. Source of randomness for picking the
+            challenge and forfeit penalties. Defaults to the `random` module.
 
     Returns:
-        tuple: (updated tribeMates list, boolean indicating if player was eliminated)
+        tuple: (updated TribeState, boolean indicating if player was eliminated)
     """
 
     print("\n🏆 ⚔️ It's time for the immunity challenge!")
 
-    challengeClasses = [
-        TraitChallenge,
-        TribeMemoryChallenge,
-        NumberGuessChallenge,
-        RiddleChallenge,
-        LogicChallenge,
-        AnagramChallenge
-    ]
-    challenge = random.choice(challengeClasses)()
+    if rng is None:
+        rng = random
+    challenge = rng.choice(CHALLENGE_CLASSES)()
 
-    print(f"\n🧩 Today's challenge: {challenge.name}")
-    print("1️⃣ Choose to compete")
-    print("2️⃣ Forfeit (Give up immunity)")
+    sys.stdout.write(f"\n🧩 Today's challenge: {challenge.name}\n"
+                     "1️⃣ Choose to compete\n"
+                     "2️⃣ Forfeit (Give up immunity)\n")
 
     choice = input("\n💡 Choose an option (1 or 2): ").strip()
 
     if choice == "2":
-        healthPenalty = int(player.currentHealth * random.uniform(0.1, 0.3))
-        socialPenalty = random.randint(5, 15)
-        player.modifyHealth(-healthPenalty)
-        player.modifySocialStatus(-socialPenalty)
+        healthPenalty = int(player.currentHealth * rng.uniform(0.1, 0.3))
+        socialPenalty = rng.randint(5, 15)
+        player.applyOutcome(-healthPenalty, -socialPenalty)
 
-        print("\n😞 You FORFEIT the challenge.")
-        print(f"💔 Lost {healthPenalty} health and -{socialPenalty} Social Status.")
+        sys.stdout.write(
+            f"\n😞 You FORFEIT the challenge.\n"
+            f"💔 Lost {healthPenalty} health and -{socialPenalty} Social Status.\n")
         return tribalCouncil(player, tribeMates)
 
-    success = challenge.startChallenge(player, tribeMates)
-
-    if success:
-        print("\n🎉 You WIN the immunity challenge!")
-    else:
-        print("\n❌ You LOST the challenge.")
-
-    print(f"🏥 Health: {player.currentHealth}/{player.maxHealth}")
-    print(f"📊 Social Status: {player.socialStatus}")
+    # The challenge reports the result and updated stats itself
+    challenge.startChallenge(player, tribeMates)
 
     print("\n🔥 Grab your torch! It's time for Tribal Council...")
     input("Press Enter to continue...")
@@ -397,16 +391,21 @@ class Character:
     social status, attributes, and flaws.
 
     @param name: str. The character's name.
-    @param attributes: list[str]. Positive traits that boost stats.
-    @param flaws: list[str]. Negative traits that reduce stats.
+    @param attributes: list[str]. Positive traits that boost stats. Stored as
+                       a tuple of interned strings.
+    @param flaws: list[str]. Negative traits that reduce stats. Stored as a
+                  tuple of interned strings.
     @param currentHealth: int. Optional. The character's current health level.
     @param maxHealth: int. Optional. The character's maximum health.
     @param socialStatus: int. Optional. The character's current social standing.
     """
+    __slots__ = ("name", "attributes", "flaws", "maxHealth", "currentHealth",
+                 "socialStatus", "inventory")
+
     def __init__(self, name, attributes, flaws, currentHealth=None, maxHealth=None, socialStatus=None ):
         self.name = name
-        self.attributes = attributes
-        self.flaws = flaws
+        self.attributes = tuple(map(intern, attributes))
+        self.flaws = tuple(map(intern, flaws))
         self.maxHealth = 100
         self.inventory = []
 
@@ -444,6 +443,18 @@ class Character:
         """
         self.socialStatus = max(0, self.socialStatus + amount)
 
+    def applyOutcome(self, healthDelta, socialDelta):
+        """
+        Applies a health change and a social status change in one call, with
+        the same clamping as `modifyHealth` and `modifySocialStatus`.
+
+        @param healthDelta: int. Amount to adjust health.
+        @param socialDelta: int. Amount to adjust social status.
+        """
+        self.currentHealth = max(0, min(self.maxHealth,
+                                        self.currentHealth + healthDelta))
+        self.socialStatus = max(0, self.socialStatus + socialDelta)
+
     def initializeStats(self):
         """
         Initializes and adjusts the character's health and social status
@@ -476,6 +487,29 @@ class Character:
             "inventory": self.inventory if hasattr(self, "inventory") else []
         }
 
+    def __getstate__(self):
+        """
+        Packs the character's state into a compact tuple for pickling.
+
+        @return: tuple. Name, attributes, flaws, current health, max health,
+                 social status, and inventory.
+        """
+        return (self.name, self.attributes, self.flaws, self.currentHealth,
+                self.maxHealth, self.socialStatus, self.inventory)
+
+    def __setstate__(self, state):
+        """
+        Restores the character from the tuple built by `__getstate__`. The
+        inventory is copied so that `copy()` never shares it between objects.
+
+        @param state: tuple. The pickled character state.
+        """
+        (self.name, attributes, flaws, self.currentHealth,
+         self.maxHealth, self.socialStatus, inventory) = state
+        self.inventory = list(inventory)
+        self.attributes = tuple(map(intern, attributes))
+        self.flaws = tuple(map(intern, flaws))
+
 #HERO SUBCLASS AND CHARACTERS
 class Hero(Character):
     """
@@ -489,6 +523,8 @@ class Hero(Character):
     @param maxHealth: int. Optional. The player's max health.
     @param socialStatus: int. Optional. The player's social standing.
     """
+    __slots__ = ("isPlayer", "hasIdol")
+
     def __init__(self, name, attributes, flaws, currentHealth=100, maxHealth=100, socialStatus=50):
         super().__init__(name, attributes, flaws, currentHealth, maxHealth,
         socialStatus)
@@ -519,6 +555,24 @@ class Hero(Character):
         """
         return super().toDict()
 
+    def __getstate__(self):
+        """
+        Adds the Hero's idol status to the pickled character state.
+
+        @return: tuple. The Character state followed by `hasIdol`.
+        """
+        return super().__getstate__() + (self.hasIdol,)
+
+    def __setstate__(self, state):
+        """
+        Restores the Hero, including whether they hold an idol.
+
+        @param state: tuple. The pickled Hero state.
+        """
+        super().__setstate__(state[:-1])
+        self.isPlayer = True
+        self.hasIdol = state[-1]
+
     def explore(self):
         """
         Allows the player to explore the island to find idols or build
@@ -535,26 +589,29 @@ class Hero(Character):
                 print(" You found another idol...but you already have one.")
             else:
                 self.hasIdol = True
-                print("🎉 Congratulations! You found a Hidden Immunity Idol.")
                 self.inventory.append("Hidden Immunity Idol")
                 self.currentHealth = self.maxHealth
-                print("💪 Your health is fully restored!")
+                sys.stdout.write(
+                    "🎉 Congratulations! You found a Hidden Immunity Idol.\n"
+                    "💪 Your health is fully restored!\n")
 
         elif outcome == "caught":
-            print("😳 Oh no! You were caught searching for an idol.")
             self.modifySocialStatus(-20)
-            print("📉 Your social status decreases by 20.")
+            sys.stdout.write("😳 Oh no! You were caught searching for an idol.\n"
+                             "📉 Your social status decreases by 20.\n")
 
         elif outcome == "buildAlliance":
-            print("🤝 You encounter another tribe member while exploring.")
-            print("After spending time together, you decide to form an alliance!")
             self.modifySocialStatus(10)
-            print("📈 Your social status increases by 10.")
+            sys.stdout.write(
+                "🤝 You encounter another tribe member while exploring.\n"
+                "After spending time together, you decide to form an alliance!\n"
+                "📈 Your social status increases by 10.\n")
 
         else:
-            print("🕵 You searched for hours, got sunburned, and found nothing.")
             self.modifyHealth(-10)
-            print(f"👎 You lost 10 health points. Current health: {self.currentHealth}/{self.maxHealth}")
+            sys.stdout.write(
+                f"🕵 You searched for hours, got sunburned, and found nothing.\n"
+                f"👎 You lost 10 health points. Current health: {self.currentHealth}/{self.maxHealth}\n")
 
         input("Press Enter to continue...")
 
@@ -567,13 +624,13 @@ class Hero(Character):
         input("Press Enter to continue...")
 
         restoredHealth = min(20, self.maxHealth - self.currentHealth)
-        self.modifyHealth(restoredHealth)
-        self.modifySocialStatus(-25)
+        self.applyOutcome(restoredHealth, -25)
 
-        print(f"💤 You recovered {restoredHealth} health.")
-        print(f"📉 But your social status dropped by 25 for being less active.")
-        print(f"🏥 Current Health: {self.currentHealth}/{self.maxHealth}")
-        print(f"📊 Social Status: {self.socialStatus}")
+        sys.stdout.write(
+            f"💤 You recovered {restoredHealth} health.\n"
+            f"📉 But your social status dropped by 25 for being less active.\n"
+            f"🏥 Current Health: {self.currentHealth}/{self.maxHealth}\n"
+            f"📊 Social Status: {self.socialStatus}\n")
 
         input("Press Enter to continue...")
 
@@ -591,22 +648,32 @@ class Enemy(Character):
     @param maxHealth: int. Optional. The character's max health.
     @param socialStatus: int. Optional. The character's social standing.
     """
+    __slots__ = ("isPlayer", "hasIdol")
+
     def __init__(self, name, attributes, flaws, currentHealth=None, maxHealth=100,
                  socialStatus=None):
         super().__init__(name, attributes, flaws, currentHealth, maxHealth, socialStatus)
         self.isPlayer = False
         self.hasIdol = False #tracks immunity idol
 
-    def castVote(self, choices):
+    def castVote(self, choices, ownIndex=None):
         """
         Randomly selects a name from the list of available tribe mates to vote out.
 
         @param choices: list[str]. Names of tribe mates eligible for elimination.
+        @param ownIndex: int. Optional. Position of this tribe mate in `choices`,
+                         which is then skipped so they never vote for themselves.
 
         @return: str. The name of the tribe mate voted against.
         """
+        if ownIndex is None:
+            return random.choice(choices)
 
-        return random.choice(choices)
+        # Pick from every slot but our own without building a filtered list
+        pick = random.randrange(len(choices) - 1)
+        if pick >= ownIndex:
+            pick += 1
+        return choices[pick]
 
     def toDict(self):
         """
@@ -616,6 +683,16 @@ class Enemy(Character):
         """
         return super().toDict()
 
+    def __setstate__(self, state):
+        """
+        Restores the tribe mate from its pickled Character state.
+
+        @param state: tuple. The pickled character state.
+        """
+        super().__setstate__(state)
+        self.isPlayer = False
+        self.hasIdol = False
+
 #Character dictionary updated with Hero instances
 CHARACTERS = {
     "Evvie": Hero(
@@ -635,36 +712,54 @@ CHARACTERS = {
     )
 }
 
+assert all(isinstance(hero, Hero) for hero in CHARACTERS.values()), \
+    "CHARACTERS must contain Hero instances"
+
+#Character selection entries, rendered once for the new game menu
+CHARACTER_SUMMARIES = {
+    name: (f"\n🔹 {name}\n"
+           f"   🏅 Attributes: {', '.join(hero.attributes)}\n"
+           f"   😈️ Flaws: {', '.join(hero.flaws)}")
+    for name, hero in CHARACTERS.items()
+}
+
 #SAVE GAME
-import json
-import os
+# The save/load modules are imported on first use, so sessions that never
+# save don't pay for them at startup.
 
-# File path for saved data
-saveFile = os.path.join(os.getcwd(), "survivorRpgSave.json")
-print(f"📂 Saving file at: {saveFile}")
+def saveFilePath():
+    """
+    Builds the path of the save file in the current working directory.
+
+    @return: str. Path to the save file.
+    """
+    return os.path.join(os.getcwd(), "survivorRpgSave.pkl")
 
 def saveGame(player, tribeMates, eliminatedTribeMates, day):
     """
-    Saves the current game state to a JSON file including the player,
+    Saves the current game state to a pickle file including the player,
     tribe mates, eliminated tribe mates, and day count.
 
     @param player: Hero. The player character.
-    @param tribeMates: list[Enemy]. Current tribe mates.
+    @param tribeMates: TribeState. Current tribe mates.
     @param eliminatedTribeMates: list[Enemy]. Eliminated tribe members.
     @param day: int. Current day in the game.
     """
+    import pickle
+
     print("\n💾 Attempting to save game...")
+    saveFile = saveFilePath()
 
     gameState = {
-        "player": player.toDict(),
-        "tribeMates": [mate.toDict() for mate in tribeMates],
-        "eliminatedTribeMates": [mate.toDict() for mate in eliminatedTribeMates],
+        "player": player,
+        "tribeMates": list(tribeMates),
+        "eliminatedTribeMates": eliminatedTribeMates,
         "day": day
     }
 
     try:
-        with open(saveFile, "w") as file:
-            json.dump(gameState, file, indent=4)
+        with open(saveFile, "wb") as file:
+            pickle.dump(gameState, file, protocol=pickle.HIGHEST_PROTOCOL)
         print("✅ Game saved successfully!")
         print(f"📂 The file is located here: {saveFile}")
     except Exception as e:
@@ -672,66 +767,47 @@ def saveGame(player, tribeMates, eliminatedTribeMates, day):
 
 def loadGame():
     """
-   Loads the saved game from a JSON file and reconstructs the player,
-   tribe mates, and eliminated tribe mates.
+   Loads the saved game from a pickle file, which restores the player,
+   tribe mates, and eliminated tribe mates directly.
 
    @return: dict or None. Game state including player, tribeMates,
             eliminatedTribeMates, and day if successful. Returns None
             if loading fails or save file does not exist.
    """
+    import pickle
+
+    saveFile = saveFilePath()
     if not os.path.exists(saveFile):
         print("\n⚠️ No saved game found.")
         return None
 
     try:
-        with open(saveFile, "r") as file:
-            gameState = json.load(file)
-
-        print(f"\n📂 Loaded Game Data: {json.dumps(gameState, indent=4)}")
-
-        playerDict = gameState["player"]
-        player = Hero(
-            name=playerDict["name"],
-            attributes=playerDict["attributes"],
-            flaws=playerDict["flaws"],
-            currentHealth=playerDict["currentHealth"],
-            maxHealth=playerDict["maxHealth"],
-            socialStatus=playerDict["socialStatus"]
-        )
-        player.inventory = playerDict.get("inventory", [])
-
-        tribeMates = []
-        for tribeMateDict in gameState["tribeMates"]:
-            tribeMate = Enemy(
-                name=tribeMateDict["name"],
-                attributes=tribeMateDict["attributes"],
-                flaws=tribeMateDict["flaws"],
-                currentHealth=tribeMateDict["currentHealth"],
-                maxHealth=tribeMateDict["maxHealth"],
-                socialStatus=tribeMateDict["socialStatus"]
-            )
-            tribeMates.append(tribeMate)
-
-        eliminatedTribeMates = []
-        for tribeMateDict in gameState["eliminatedTribeMates"]:
-            tribeMate = Enemy(
-                name=tribeMateDict["name"],
-                attributes=tribeMateDict["attributes"],
-                flaws=tribeMateDict["flaws"],
-                currentHealth=tribeMateDict["currentHealth"],
-                maxHealth=tribeMateDict["maxHealth"],
-                socialStatus=tribeMateDict["socialStatus"]
-            )
-            eliminatedTribeMates.append(tribeMate)
+        with open(saveFile, "rb") as file:
+            gameState = pickle.load(file)
 
+        player = gameState["player"]
+        tribeMates = TribeState(gameState["tribeMates"])
+        eliminatedTribeMates = gameState["eliminatedTribeMates"]
         day = gameState.get("day", 1)
 
+        # Dumping the whole save is only useful when debugging
+        if os.environ.get("SURVIVOR_DEBUG"):
+            import json
+
+            loadedData = {
+                "player": player.toDict(),
+                "tribeMates": [mate.toDict() for mate in tribeMates],
+                "eliminatedTribeMates": [mate.toDict() for mate in eliminatedTribeMates],
+                "day": day
+            }
+            print(f"\n📂 Loaded Game Data: {json.dumps(loadedData, indent=4)}")
+
         print("✅ Game loaded successfully!")
         return {
             "player": player,
             "tribeMates": tribeMates,
             "eliminatedTribeMates": eliminatedTribeMates,
-            "day": gameState.get("day", 1)
+            "day": day
         }
     except Exception as e:
         print(f"\n⚠️ Error loading game: {e}")
@@ -746,47 +822,92 @@ has unique skills, weaknesses, and statistics that affects performance. Each
 character is based on a real Survivor player. 
 """
 
-ATTRIBUTE_SCORES = {
-    "Extrovert": 5, "Disarming": 10, "Smart": 7, "Confident": 8,
-    "Athletic": 6, "Resourceful": 7, "Sneaky": 4, "Sweet": 5, "Charismatic": 9,
-    "Patient": 6, "Resilient": 9
-}
+# Pools sampled by generateTribe, built once instead of on every call
+ATTR_KEYS = tuple(ATTRIBUTE_SCORES)
+FLAW_KEYS = tuple(FLAW_PENALTIES)
 
-FLAW_PENALTIES = {
-    "Cerebral": -4, "Naive": -2, "Unathletic": -5, "Moody": -6,
-    "Insecure": -7, "Follower": -3, "Delusionally Confident": -6,
-    "Self-Indulgent": -5, "Jealous": -8, "Blunt": -10
-}
+TRIBE_NAMES = (
+    "Brice", "Cirie", "Zeke", "Boston Rob", "Tasha", "Spencer",
+    "Jaison", "Fabio", "Kass", "Ozzy", "Shan", "Adam", "Franny", "Q", "Donathan",
+    "Desi", "Katurah", "Shambo", "Wendell", "Rachel", "Hunter", "Venus"
+)
 
 
 #TRIBE MATES
-def generateTribe():
+class TribeState:
+    """
+    Holds the current tribe mates alongside a name lookup and the cached
+    alphabetical order of their names, both kept up to date as tribe mates
+    are removed. Iterates, indexes, and measures like the underlying list of
+    tribe mates.
+
+    @param mates: list[Enemy]. The tribe mates.
+    """
+    def __init__(self, mates):
+        self.mates = list(mates)
+        self.byName = {mate.name: mate for mate in self.mates}
+        self._sortedNames = None
+
+    def __len__(self):
+        return len(self.mates)
+
+    def __iter__(self):
+        return iter(self.mates)
+
+    def __getitem__(self, index):
+        return self.mates[index]
+
+    @property
+    def sortedNames(self):
+        """
+        The tribe mates' names in alphabetical order, sorted on first use.
+
+        @return: tuple[str]. Sorted tribe mate names.
+        """
+        if self._sortedNames is None:
+            self._sortedNames = tuple(sorted(mate.name for mate in self.mates))
+        return self._sortedNames
+
+    def remove(self, mate):
+        """
+        Removes a tribe mate, keeping the cached name order sorted.
+
+        @param mate: Enemy. The tribe mate to remove.
+        """
+        self.mates.remove(mate)
+        del self.byName[mate.name]
+        if self._sortedNames is not None:
+            self._sortedNames = tuple(name for name in self._sortedNames
+                                      if name != mate.name)
+
+
+def generateTribe(rng=None):
     """
     Generates 5 random tribe members with randomized attributes, flaws, and health.
 
+    Parameters:
+    rng (random.Random): Optional. Source of randomness, e.g. a seeded
+        instance for repeatable tribes. Defaults to the `random` module.
+
     Returns:
-        list of Enemy objects (tribe mates).
+        TribeState of Enemy objects (tribe mates).
     """
+    sample = (random if rng is None else rng).sample
     tribe = []
-    names = [
-        "Brice", "Cirie", "Zeke", "Boston Rob", "Tasha", "Spencer",
-        "Jaison", "Fabio", "Kass", "Ozzy", "Shan", "Adam", "Franny", "Q", "Donathan",
-        "Desi", "Katurah", "Shambo", "Wendell", "Rachel", "Hunter", "Venus"
-    ]
-    for name in random.sample(names, 5):
-        attributes = random.sample(list(ATTRIBUTE_SCORES.keys()), 3)
-        flaws = random.sample(list(FLAW_PENALTIES.keys()), 3)
+    for name in sample(TRIBE_NAMES, 5):
+        attributes = sample(ATTR_KEYS, 3)
+        flaws = sample(FLAW_KEYS, 3)
         tribeMate = Enemy(name, attributes, flaws)
         tribe.append(tribeMate)
 
-    return tribe
+    return TribeState(tribe)
 
 def displayTribe(tribeMates):
     """
     Displays the tribe mates' names, attributes, flaws, and stats.
 
     Parameters:
-    tribeMates (list): List of Enemy objects to display.
+    tribeMates (TribeState): Enemy objects to display.
 
     Returns: None
     """
@@ -807,60 +928,54 @@ def tribalCouncil(player, tribeMates):
     one player. Handles vote tallying, tie-breaker revote, and final decision.
 
     @param player: Hero. The player character.
-    @param tribeMates: list[Enemy]. List of current tribe members.
+    @param tribeMates: TribeState. The current tribe members.
 
     @return: tuple. Updated tribe mates list and a bool indicating if
              the player was eliminated.
     """
 
-    print("\n🔥 Tribal Council 🔥")
-    print("Welcome to tribal council! Who will be voted out tonight?\n")
-
-    print("Tribe members who can be voted out (excluding yourself):")
-    for mate in tribeMates:
-        print(f"🔹 {mate.name}")
-    print("\n")
+    validNames = tribeMates.sortedNames
 
-    print(f"⚡️{player.name}'s Social Status: {player.socialStatus}")
-    print(f"🔅{player.name}'s Health: {player.currentHealth}/{player.maxHealth}\n")
+    sys.stdout.write(
+        "\n🔥 Tribal Council 🔥\n"
+        "Welcome to tribal council! Who will be voted out tonight?\n\n"
+        "Tribe members who can be voted out (excluding yourself):\n"
+        + "".join(f"🔹 {name}\n" for name in validNames)
+        + f"\n\n⚡️{player.name}'s Social Status: {player.socialStatus}\n"
+        f"🔅{player.name}'s Health: {player.currentHealth}/{player.maxHealth}\n\n")
 
-    validNames = [mate.name for mate in tribeMates]
     playerVote = player.castVote(validNames)# Player vote
-
-    # Initialize vote tally
-    votes = {name: 0 for name in validNames + [player.name]}
     voteWeight = 2 if player.socialStatus > 75 else 1
-    votes[playerVote] += voteWeight
+    voteList = [playerVote] * voteWeight
 
     # Tribe members cast their votes randomly
-    for mate in tribeMates:
-        otherCandidates = [name for name in validNames if name != mate.name]
-        vote = mate.castVote(otherCandidates)
-        votes[vote] += 1
+    for index, name in enumerate(validNames):
+        voteList.append(tribeMates.byName[name].castVote(validNames, index))
 
-    print("\n🗳️The votes have been tallied:")
-    for name, count in sorted(votes.items(), key=lambda item: -item[1]):
-        print(f"   {name}: {count} vote(s)")
+    ordered = Counter(voteList).most_common()
 
-    maxVotes = max(votes.values())
-    eliminatedCandidates = [name for name, count in votes.items() if count ==
+    sys.stdout.write("\n🗳️The votes have been tallied:\n"
+                     + "".join(f"   {name}: {count} vote(s)\n"
+                               for name, count in ordered))
+
+    maxVotes = ordered[0][1]
+    eliminatedCandidates = [name for name, count in ordered if count ==
                             maxVotes]
 
     # If there's a tie, trigger a revote
     if len(eliminatedCandidates) > 1:
         print("\n⚠️ There is a tie! A revote will take place.")
-        votes = {name: 0 for name in eliminatedCandidates}
 
         playerVote = player.castVote(eliminatedCandidates)
-        votes[playerVote] += voteWeight
+        voteList = [playerVote] * voteWeight
 
         # Tribe revotes for the tied contestants
-        for mate in tribeMates:
-            vote = mate.castVote(eliminatedCandidates)
-            votes[vote] += 1
+        voteList.extend(mate.castVote(eliminatedCandidates) for mate in tribeMates)
+
+        ordered = Counter(voteList).most_common()
 
-        maxVotes = max(votes.values())
-        eliminatedCandidates = [name for name, count in votes.items() if count == maxVotes]
+        maxVotes = ordered[0][1]
+        eliminatedCandidates = [name for name, count in ordered if count == maxVotes]
 
         # If there's another tie, eliminate at random
         if len(eliminatedCandidates) > 1:
@@ -871,20 +986,61 @@ def tribalCouncil(player, tribeMates):
     else:
         eliminated = eliminatedCandidates[0]
 
-    print("\n📜 Final vote tally:")
-    for name, count in sorted(votes.items(), key=lambda item: -item[1]):
-        print(f"   {name}: {count} vote(s)")
+    sys.stdout.write("\n📜 Final vote tally:\n"
+                     + "".join(f"   {name}: {count} vote(s)\n"
+                               for name, count in ordered))
 
     if eliminated == player.name:
-        print(f"☠️ {player.name} was eliminated! The tribe has spoken.")
-        print("\n💀 **GAME OVER. You have been voted out.** 💀")
-        print("🏝️ Thank you for playing Survivor: Python Edition! 🏝️")
+        sys.stdout.write(
+            f"☠️ {player.name} was eliminated! The tribe has spoken.\n"
+            "\n💀 **GAME OVER. You have been voted out.** 💀\n"
+            "🏝️ Thank you for playing Survivor: Python Edition! 🏝️\n")
         return None, True
 
     else:
         print(f"❌ {eliminated} was voted out of the tribe.")
-        updatedTribe = [mate for mate in tribeMates if mate.name != eliminated]
-        return updatedTribe, False
+        tribeMates.remove(tribeMates.byName[eliminated])
+        return tribeMates, False
+
+#FINAL TRIBAL COUNCIL
+def readPauseScale():
+    """
+    Reads the multiplier for the dramatic pauses from the environment.
+    SURVIVOR_FAST or SURVIVOR_PAUSE=0 skips them entirely; a value that is not
+    a finite number falls back to normal pace, and a negative one counts as 0.
+
+    @return: float. The pause multiplier, never negative.
+    """
+    if os.environ.get("SURVIVOR_FAST"):
+        return 0.0
+    try:
+        scale = float(os.environ.get("SURVIVOR_PAUSE", "1.0"))
+    except ValueError:
+        return 1.0
+    if not math.isfinite(scale):
+        return 1.0
+    return max(0.0, scale)
+
+PAUSE_SCALE = readPauseScale()
+
+def pause(seconds):
+    """
+    Waits for a dramatic pause, scaled by PAUSE_SCALE.
+
+    @param seconds: float. Length of the pause at normal pace.
+    """
+    if PAUSE_SCALE:
+        time.sleep(seconds * PAUSE_SCALE)
+
+#Answers the player can give the jury, in menu order
+FINAL_ARGUMENTS = (
+    "I will use it to support my family.",
+    "I will use it to chase a dream.",
+    "I will use it for whatever I want - it's my money."
+)
+
+#Menu entries accepted at Final Tribal Council
+FINAL_CHOICES = frozenset({"1", "2", "3"})
 
 def finalTribalCouncil(player, opponent, jury):
     """
@@ -898,39 +1054,33 @@ def finalTribalCouncil(player, opponent, jury):
     :return: str. The name of the Sole Survivor.
     """
 
-    print("\n🏆 **FINAL TRIBAL COUNCIL** 🏆")
-    print("Make your case to the jury to vote you to be Sole Survivor.")
-
-    print("\n❓ The jury asks you: \"What will you do with the money?\"")
-    print("1️⃣ I will use it to support my family.")
-    print("2️⃣ I will use it to chase a dream.")
-    print("3️⃣ I will use it for whatever I want - it's my money.")
+    sys.stdout.write(
+        "\n🏆 **FINAL TRIBAL COUNCIL** 🏆\n"
+        "Make your case to the jury to vote you to be Sole Survivor.\n"
+        "\n❓ The jury asks you: \"What will you do with the money?\"\n"
+        "1️⃣ I will use it to support my family.\n"
+        "2️⃣ I will use it to chase a dream.\n"
+        "3️⃣ I will use it for whatever I want - it's my money.\n")
 
     while True:
         finalCase = input("\n💡 Select your answer (1, 2, or 3): ").strip()
-        if finalCase in ["1", "2", "3"]:
+        if finalCase in FINAL_CHOICES:
             break
         print("❌ Invalid choice! Please enter 1, 2, or 3.")
 
-    arguments = {
-        "1": "I will use it to support my family.",
-        "2": "I will use it to chase a dream.",
-        "3": "I will use it for whatever I want - it's my money."
-    }
-
-    userResponse = arguments[finalCase]
+    userResponse = FINAL_ARGUMENTS[int(finalCase) - 1]
     print(f"\n💬 You respond: \"{userResponse}\"")
 
     print("\n🤔 The jury is deliberating...")
-    time.sleep(3)
+    pause(3)
     print("🗳️ The votes are being cast...")
-    time.sleep(2)
+    pause(2)
 
     # Jury randomly determines if they approve or not.
     juryApproval = random.choice(["approve", "disapprove"])
 
     print("\n📜 The final vote result is being revealed...")
-    time.sleep(3)
+    pause(3)
 
     if juryApproval == "approve":
         print("\n🌟 The jury nods and says: \"Have a beautiful life.\"")
@@ -941,17 +1091,18 @@ def finalTribalCouncil(player, opponent, jury):
             "money!\"")
         winner = opponent.name
 
-    time.sleep(2)
+    pause(2)
     if winner == player.name:
-        print(f"\n🥇**CONGRATULATIONS! You earned every jury vote!** 🎉")
-        print(
-            "🎇 You have outwitted, outplayed, and outlasted everyone to win "
-            "Survivor!")
+        outcome = ("\n🥇**CONGRATULATIONS! You earned every jury vote!** 🎉\n"
+                   "🎇 You have outwitted, outplayed, and outlasted everyone to win "
+                   "Survivor!")
     else:
-        print(f"\n💔 **{opponent.name} won the majority of the jury votes.**")
-        print("😞 The jury has spoken. You are not the Sole Survivor.")
+        outcome = (f"\n💔 **{opponent.name} won the majority of the jury votes.**\n"
+                   "😞 The jury has spoken. You are not the Sole Survivor.")
 
-    print("\n🏝️ **GAME OVER. Thank you for playing Survivor: Python Edition!** 🏝️")
+    sys.stdout.write(
+        outcome
+        + "\n\n🏝️ **GAME OVER. Thank you for playing Survivor: Python Edition!** 🏝️\n")
     return winner
 
 
@@ -963,7 +1114,7 @@ def mainGameLoop(player=None, tribeMates=None, eliminatedTribeMates=None, day=1,
 
     @param player: Hero or None. Optional. The player character. If not provided,
                    the user will select a new one.
-    @param tribeMates: list[Enemy] or None. Optional. The current tribe members.
+    @param tribeMates: TribeState or None. Optional. The current tribe members.
     @param eliminatedTribeMates: list[Enemy] or None. Optional. The eliminated tribe members.
     @param day: int. The current day in the game.
     @param isNewGame: bool. Indicates whether the session is a new game.
@@ -1033,14 +1184,8 @@ def mainGameLoop(player=None, tribeMates=None, eliminatedTribeMates=None, day=1,
 
         # Survivor character selection
         print("Choose your Survivor contestant:")
-        for name, details in CHARACTERS.items():
-            # Safeguard to ensure `details` is a dictionary
-            if not isinstance(details, Hero):
-                raise TypeError()
-                raise TypeError(f"Invalid character data for {name}. Expected a Hero object, got {type(details).__name__}")
-            print(f"\n🔹 {name}")
-            print(f"   🏅 Attributes: {', '.join(details.attributes)}")
-            print(f"   😈️ Flaws: {', '.join(details.flaws)}")
+        for summary in CHARACTER_SUMMARIES.values():
+            print(summary)
 
         while True:
             playerName = input(
@@ -1049,16 +1194,10 @@ def mainGameLoop(player=None, tribeMates=None, eliminatedTribeMates=None, day=1,
                 break
             print("❌ Invalid choice. Please enter a valid name.")
 
-        # Create the player as a Hero object
-        player = Hero(
-            name=playerName,
-            attributes=CHARACTERS[playerName].attributes,
-            flaws=CHARACTERS[playerName].flaws,
-            currentHealth=CHARACTERS[playerName].currentHealth,
-            maxHealth=CHARACTERS[playerName].maxHealth
-        )
+        # Create the player as a copy of the chosen Hero template
+        player = copy(CHARACTERS[playerName])
 
-        tribeMates = generateTribe()  # Should return Enemy instances
+        tribeMates = generateTribe()  # TribeState of Enemy instances
         eliminatedTribeMates = []
         displayTribe(tribeMates)
 
@@ -1084,13 +1223,14 @@ def mainGameLoop(player=None, tribeMates=None, eliminatedTribeMates=None, day=1,
                 "Enter an action (rest, explore, challenge, status, help, save, exit): ").strip().lower()
 
             if action == "help":
-                print("\n📜 Menu:")
-                print("- 💤 rest: Recover health.")
-                print("- 🔍 explore: Search for hidden advantages.")
-                print("- ⚔️ challenge: Compete in an immunity challenge.")
-                print("- 📊 status: View your current health and social status.")
-                print("- 💾 save: Save your game.")
-                print("- 🚪 exit: Quit the game.")
+                sys.stdout.write(
+                    "\n📜 Menu:\n"
+                    "- 💤 rest: Recover health.\n"
+                    "- 🔍 explore: Search for hidden advantages.\n"
+                    "- ⚔️ challenge: Compete in an immunity challenge.\n"
+                    "- 📊 status: View your current health and social status.\n"
+                    "- 💾 save: Save your game.\n"
+                    "- 🚪 exit: Quit the game.\n")
 
             elif action == "exit":
                 print("\n👋 You have exited the game. Thanks for playing!")
@@ -1119,11 +1259,12 @@ def mainGameLoop(player=None, tribeMates=None, eliminatedTribeMates=None, day=1,
                 break
 
             elif action == "status":
-                print("\n📊 Current Status:")
-                print(f"⚡️ Health: {player.currentHealth} / {player.maxHealth}")
-                print(f"📈 Social Status: {player.socialStatus}\n")
-                if player.hasIdol:
-                    print("   🗿 Holding a Hidden Immunity Idol!")
+                sys.stdout.write(
+                    f"\n📊 Current Status:\n"
+                    f"⚡️ Health: {player.currentHealth} / {player.maxHealth}\n"
+                    f"📈 Social Status: {player.socialStatus}\n\n"
+                    + ("   🗿 Holding a Hidden Immunity Idol!\n"
+                       if player.hasIdol else ""))
 
             elif action == "save":
                 saveGame(player, tribeMates, eliminatedTribeMates, day)
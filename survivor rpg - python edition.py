@@ -8,7 +8,13 @@ you outwit, outplay, and outlast the other castaways, you are the Sole Survivor
 the winner of one million dollars!
 """
 
+import math
+import os
 import random
+import re
+import select
+import sys
+from collections import Counter
 
 # Section 1 - Game Setup
 
@@ -20,24 +26,24 @@ character is based on a real Survivor player.
 
 CHARACTERS = {
     "Evvie": {
-        "attributes": ["Extrovert", "Disarming", "Smart"],
-        "flaws": ["Cerebral", "Naive", "Unathletic"],
+        "attributes": ("Extrovert", "Disarming", "Smart"),
+        "flaws": ("Cerebral", "Naive", "Unathletic"),
         "currentHealth": 90,
         "maxHealth": 100,
         "inventory": [],
         "socialStatus": 0
     },
     "Teeny": {
-        "attributes": ["Disarming", "Sneaky", "Sweet"],
-        "flaws": ["Moody", "Insecure", "Follower"],
+        "attributes": ("Disarming", "Sneaky", "Sweet"),
+        "flaws": ("Moody", "Insecure", "Follower"),
         "currentHealth": 80,
         "maxHealth": 100,
         "inventory": [],
         "socialStatus": 0
     },
     "Parvati": {
-        "attributes": ["Confident", "Athletic", "Resourceful"],
-        "flaws": ["Delusionally Confident", "Self-Indulgent", "Jealous"],
+        "attributes": ("Confident", "Athletic", "Resourceful"),
+        "flaws": ("Delusionally Confident", "Self-Indulgent", "Jealous"),
         "currentHealth": 100,
         "maxHealth": 100,
         "inventory": [],
@@ -57,6 +63,17 @@ FLAW_PENALTIES = {
     "Self-Indulgent": -5, "Jealous": -8, "Blunt": -10
 }
 
+# Character selection menu, rendered once instead of on every new game
+CHARACTER_MENU_STR = "\n".join(
+    f"\n🔹 {name}\n"
+    f"   🏅 Attributes: {', '.join(details['attributes'])}\n"
+    f"   😈️ Flaws: {', '.join(details['flaws'])}"
+    for name, details in CHARACTERS.items())
+
+# Trait pools sampled by generateTribe, built once instead of per tribe member
+ATTR_KEYS = tuple(ATTRIBUTE_SCORES)
+FLAW_KEYS = tuple(FLAW_PENALTIES)
+
 
 # Section 2 - Attributes and Flaws
 
@@ -73,15 +90,15 @@ def initializeStats(character):
     baseSocialStatus = 50
     baseHealth = character["currentHealth"]
 
+    # Each score is looked up once and feeds both social status and health.
     for attr in character.get("attributes", []):
-        baseSocialStatus += ATTRIBUTE_SCORES.get(attr, 0)
+        score = ATTRIBUTE_SCORES.get(attr, 0)
+        baseSocialStatus += score
+        baseHealth += score // 2
     for flaw in character.get("flaws", []):
-        baseSocialStatus += FLAW_PENALTIES.get(flaw, 0)
-
-    for attr in character["attributes"]:
-        baseHealth += ATTRIBUTE_SCORES.get(attr, 0) // 2
-    for flaw in character["flaws"]:
-        baseHealth += FLAW_PENALTIES.get(flaw, 0) // 2
+        score = FLAW_PENALTIES.get(flaw, 0)
+        baseSocialStatus += score
+        baseHealth += score // 2
 
     character["socialStatus"] = max(0, baseSocialStatus)
     character["currentHealth"] = min(baseHealth, character["maxHealth"])
@@ -102,8 +119,8 @@ def generateTribe():
         "Tiffany", "Katurah", "Shambo", "Wendell", "Rachel", "Hunter", "Venus"
     ]
     for name in random.sample(names, 5):
-        attributes = random.sample(list(ATTRIBUTE_SCORES.keys()), 3)
-        flaws = random.sample(list(FLAW_PENALTIES.keys()), 3)
+        attributes = random.sample(ATTR_KEYS, 3)
+        flaws = random.sample(FLAW_KEYS, 3)
         currentHealth = 70 + 10 * ("Resilient" in attributes) - 5 * (
                 "Reckless" in flaws)
         member = {
@@ -125,12 +142,84 @@ import time
 import random
 
 # List of valid attributes and flaws for the trait challenge.
-VALID_TRAITS = [
+VALID_TRAITS = frozenset({
     "Extrovert", "Disarming", "Smart", "Confident", "Athletic",
     "Resourceful", "Sneaky", "Sweet", "Charismatic", "Strategic",
     "Cerebral", "Naive", "Unathletic", "Moody", "Insecure",
     "Follower", "Delusionally Confident", "Self-Indulgent", "Jealous", "Blunt"
-]
+})
+
+# Challenge content as (prompt, answer) pairs, built once for random.choice.
+# Answers are lowercased here so a guess only needs lowercasing once.
+RIDDLES = tuple((riddle, answer.lower()) for riddle, answer in (
+    ("I grant safety, but remain hidden unless found. What am I?", "idol"),
+    ("With fire and parchment, I speak for the tribe. What am I?",
+     "tribal council"),
+    ("The more you win me, the longer you stay in the game. What am I?",
+     "immunity")
+))
+
+PUZZLES = tuple((puzzle, answer.lower()) for puzzle, answer in (
+    ("There are three players left: Jerri, Rupert, and Cirie. Jerri and Rupert "
+     "both voted for Cirie. Cirie didn't vote for Jerri. Who was eliminated?",
+     "cirie"),
+    ("You find a Hidden Immunity Idol. Do you play it before or after the votes "
+     "are read?", "before"),
+    ("On an island, I help you live / boil me first before I give", "water")
+))
+
+# Splits a comma-separated list of names, dropping the spaces around commas.
+NAME_SEPARATOR = re.compile(r"\s*,\s*")
+
+# (phrase, anagram) pairs for the anagram challenge.
+PHRASES = tuple((phrase.lower(), anagram) for phrase, anagram in (
+    ("fire represents life", "perresents file rife"),
+    ("the tribe has spoken", "sah nopesk brite the"),
+    ("final three", "treeh nifla")
+))
+
+
+def timedInput(prompt, timeout):
+    """
+    Reads a line of input, giving up once the time limit runs out.
+
+    On POSIX terminals this waits on stdin with select(), so the timeout
+    fires even if the player never presses Enter. Where stdin can't be
+    polled (Windows consoles, piped or redirected input) it falls back to a
+    blocking input() and checks the elapsed time afterwards.
+
+    Parameters:
+        prompt (str): Text shown before reading.
+        timeout (float): Seconds the player has to answer.
+
+    Returns:
+        str or None: The line entered, or None if time ran out.
+    """
+    ready = None
+    if sys.stdin.isatty():
+        print(prompt, end="", flush=True)
+        prompt = ""
+        try:
+            ready, _, _ = select.select([sys.stdin], [], [], timeout)
+        except OSError:
+            ready = None
+
+    if ready is None:
+        startTime = time.monotonic()
+        line = input(prompt)
+        return line if time.monotonic() - startTime <= timeout else None
+
+    if not ready:
+        # Discard anything typed but not submitted, so it can't leak into the
+        # next prompt. Only POSIX terminals get here, so termios is available.
+        import termios
+        try:
+            termios.tcflush(sys.stdin, termios.TCIFLUSH)
+        except termios.error:
+            pass
+        print()
+        return None
+    return sys.stdin.readline().rstrip("\n")
 
 
 def traitChallenge(player, tribeMates):
@@ -150,17 +239,18 @@ def traitChallenge(player, tribeMates):
     print("You must name one attribute or flaw of any character in the game!")
     print("⏳ You have **30 seconds** to enter a valid response!")
 
-    startTime = time.time()
-    userInput = input("\n💡 Enter an attribute or flaw: ").strip().title()
-    endTime = time.time()
+    userInput = timedInput("\n💡 Enter an attribute or flaw: ", 30)
 
-    if endTime - startTime > 30:
+    if userInput is None:
         print("\n⏰ **Time's up!** You failed to respond in time.")
-        player["socialStatus"] = max(0, player["socialStatus"] - 10)
-        player["currentHealth"] = max(0, player["currentHealth"] - 10)
+        socialStatus = max(0, player["socialStatus"] - 10)
+        currentHealth = max(0, player["currentHealth"] - 10)
+        player["socialStatus"] = socialStatus
+        player["currentHealth"] = currentHealth
         print("📉 **You lost -10 Social Status and -10 Health.**")
         return False  # Player loses
 
+    userInput = userInput.strip().title()
     if userInput in VALID_TRAITS:
         print(f"\n✅ **Correct!** {userInput} is a valid trait.")
         player["socialStatus"] += 25
@@ -174,13 +264,15 @@ def traitChallenge(player, tribeMates):
         return True  # Player wins
     else:
         print(f"\n❌ **Incorrect!** {userInput} is not a valid trait.")
-        player["socialStatus"] = max(0, player["socialStatus"] - 10)
-        player["currentHealth"] = max(0, player["currentHealth"] - 10)
+        socialStatus = max(0, player["socialStatus"] - 10)
+        currentHealth = max(0, player["currentHealth"] - 10)
+        player["socialStatus"] = socialStatus
+        player["currentHealth"] = currentHealth
         print("📉 **You lost -10 Social Status and -10 Health.**")
         print(
-            f"🏥 **Current Health:** {player['currentHealth']} / "
+            f"🏥 **Current Health:** {currentHealth} / "
             f"{player['maxHealth']}")
-        print(f"📊 **Social Status:** {player['socialStatus']}")
+        print(f"📊 **Social Status:** {socialStatus}")
         return False  # Player loses
 
 
@@ -198,19 +290,19 @@ def tribeMemory(player, tribeMates):
         bool: True if the player successfully orders names, False otherwise.
     """
 
-    correctOrder = sorted([mate["name"] for mate in tribeMates])
+    names = [mate["name"] for mate in tribeMates]
+    correctOrder = sorted(names)
+    correctOrderLower = [name.lower() for name in correctOrder]
     print("\n🧠 **Tribe Memory Challenge: Alphabetical Order!**")
     print("List your tribe mates in **alphabetical order**, separated by commas.")
-    print(
-        f"🌿 Your current tribe mates: "
-        f"{', '.join([mate['name'] for mate in tribeMates])}")
+    print(f"🌿 Your current tribe mates: {', '.join(names)}")
 
     userInput = input("\n💡 Enter tribe mates in alphabetical order: ").strip(
-
     ).lower()
-    userList = [name.strip().title() for name in userInput.split(",") if name.strip()]
+    userList = [name for name in NAME_SEPARATOR.split(userInput) if name]
 
-    if userList == correctOrder:
+    # Compared case-insensitively; the whole line was lowercased once above.
+    if userList == correctOrderLower:
         print("\n✅ **Correct! You remembered your tribe mates perfectly!**")
         player["socialStatus"] += 25
         player["maxHealth"] += 25
@@ -224,13 +316,15 @@ def tribeMemory(player, tribeMates):
     else:
         print("\n❌ **Incorrect order!**")
         print(f"📜 The correct order was: {', '.join(correctOrder)}")
-        player["socialStatus"] = max(0, player["socialStatus"] - 10)
-        player["currentHealth"] = max(0, player["currentHealth"] - 10)
+        socialStatus = max(0, player["socialStatus"] - 10)
+        currentHealth = max(0, player["currentHealth"] - 10)
+        player["socialStatus"] = socialStatus
+        player["currentHealth"] = currentHealth
         print("📉 **You lost -10 Social Status and -10 Health.**")
         print(
-            f"🏥 **Current Health:** {player['currentHealth']} / "
+            f"🏥 **Current Health:** {currentHealth} / "
             f"{player['maxHealth']}")
-        print(f"📊 **Social Status:** {player['socialStatus']}")
+        print(f"📊 **Social Status:** {socialStatus}")
         return False  # Player loses
 
 
@@ -264,8 +358,10 @@ def numberGame(player, tribeMates):
         return True
     else:
         print(f"\n❌ **Incorrect! The number was {correctNumber}.**")
-        player["socialStatus"] = max(0, player["socialStatus"] - 10)
-        player["currentHealth"] = max(0, player["currentHealth"] - 10)
+        socialStatus = max(0, player["socialStatus"] - 10)
+        currentHealth = max(0, player["currentHealth"] - 10)
+        player["socialStatus"] = socialStatus
+        player["currentHealth"] = currentHealth
         print(f"📉 **-10 Social Status & Health!**")
         return False
 
@@ -282,14 +378,7 @@ def riddleGame(player, tribeMates):
     Returns:
         bool: True if the player answers correctly, False otherwise.
         """
-    riddles = {
-        "I grant safety, but remain hidden unless found. What am I?": "idol",
-        "With fire and parchment, I speak for the tribe. What am I?": "tribal "
-                                                                      "council",
-        "The more you win me, the longer you stay in the game. What am I?": "immunity"
-    }
-
-    riddle, answer = random.choice(list(riddles.items()))
+    riddle, answer = random.choice(RIDDLES)
     print("\n🧠 **Survivor Riddle Challenge!**")
     print(f"❓ **Riddle:** {riddle}")
 
@@ -303,8 +392,10 @@ def riddleGame(player, tribeMates):
         return True
     else:
         print(f"\n❌ **Incorrect! The correct answer was: {answer}.**")
-        player["socialStatus"] = max(0, player["socialStatus"] - 10)
-        player["currentHealth"] = max(0, player["currentHealth"] - 10)
+        socialStatus = max(0, player["socialStatus"] - 10)
+        currentHealth = max(0, player["currentHealth"] - 10)
+        player["socialStatus"] = socialStatus
+        player["currentHealth"] = currentHealth
         print(f"📉 **-10 Social Status & Health!**")
         return False
 
@@ -321,16 +412,7 @@ def logicGame(player, tribeMates):
      Returns:
          bool: True if the player solves the logic puzzle, False otherwise.
      """
-    puzzles = {
-        "There are three players left: Jerri, Rupert, and Cirie. Jerri and Rupert "
-        "both voted for Cirie. Cirie didn't vote for Jerri. Who was eliminated?":
-            "cirie",
-        "You find a Hidden Immunity Idol. Do you play it before or after the votes "
-        "are read?": "before",
-        "On an island, I help you live / boil me first before I give": "water"
-    }
-
-    puzzle, answer = random.choice(list(puzzles.items()))
+    puzzle, answer = random.choice(PUZZLES)
     print("\n🧩 **Survivor Logic Challenge!**")
     print(f"❓ **Puzzle:** {puzzle}")
 
@@ -344,8 +426,10 @@ def logicGame(player, tribeMates):
         return True
     else:
         print(f"\n❌ **Incorrect! The correct answer was: {answer}.**")
-        player["socialStatus"] = max(0, player["socialStatus"] - 10)
-        player["currentHealth"] = max(0, player["currentHealth"] - 10)
+        socialStatus = max(0, player["socialStatus"] - 10)
+        currentHealth = max(0, player["currentHealth"] - 10)
+        player["socialStatus"] = socialStatus
+        player["currentHealth"] = currentHealth
         print(f"📉 **-10 Social Status & Health!**")
         return False
 
@@ -361,19 +445,13 @@ def anagramGame(player, tribeMates):
     Returns:
         bool: True if the player correctly solves the anagram, False otherwise.
     """
-    phrases = {
-        "fire represents life": "perresents file rife",
-        "the tribe has spoken": "sah nopesk brite the",
-        "final three": "treeh nifla"
-    }
-
-    phrase, anagram = random.choice(list(phrases.items()))
+    phrase, anagram = random.choice(PHRASES)
     print("\n🔀 **Anagram Challenge!**")
     print(f"🔄 Unscramble this Survivor phrase: **{anagram}**")
 
     userInput = input("\n💡 Enter the correct phrase: ").strip()
 
-    if userInput.lower == phrase.lower():
+    if userInput.lower() == phrase:
         print("\n✅ **Correct! You solved the anagram.**")
         player["socialStatus"] += 25
         player["currentHealth"] += 25
@@ -381,12 +459,25 @@ def anagramGame(player, tribeMates):
         return True
     else:
         print(f"\n❌ **Incorrect! The correct phrase was: {phrase}.**")
-        player["socialStatus"] = max(0, player["socialStatus"] - 10)
-        player["currentHealth"] = max(0, player["currentHealth"] - 10)
+        socialStatus = max(0, player["socialStatus"] - 10)
+        currentHealth = max(0, player["currentHealth"] - 10)
+        player["socialStatus"] = socialStatus
+        player["currentHealth"] = currentHealth
         print(f"📉 **-10 Social Status & Health!**")
         return False
 
 
+# Immunity challenge played on days 1-6; later days fall back to riddleGame.
+CHALLENGES = (
+    traitChallenge,
+    tribeMemory,
+    numberGame,
+    riddleGame,
+    logicGame,
+    anagramGame
+)
+
+
 def dailyChallenge(player, tribeMates, eliminatedTribeMates, roundNumber):
     """
     Launches a challenge where the player competes against tribe mates to gain
@@ -404,15 +495,10 @@ def dailyChallenge(player, tribeMates, eliminatedTribeMates, roundNumber):
 
     print("\n🏆 ⚔️ It's time for the immunity challenge!")
 
-    challenges = {
-        1: traitChallenge,
-        2: tribeMemory,
-        3: numberGame,
-        4: riddleGame,
-        5: logicGame,
-        6: anagramGame
-    }
-    selectedPuzzle = challenges.get(roundNumber, riddleGame)
+    if 1 <= roundNumber <= len(CHALLENGES):
+        selectedPuzzle = CHALLENGES[roundNumber - 1]
+    else:
+        selectedPuzzle = riddleGame
 
     print("\n🧩 Complete this challenge within **30 seconds**!")
     print("1️⃣ Choose to compete")
@@ -434,10 +520,10 @@ def dailyChallenge(player, tribeMates, eliminatedTribeMates, roundNumber):
         return tribalCouncil(player, tribeMates)
 
 
-    startTime = time.time()
+    startTime = time.monotonic()
     success = selectedPuzzle(player, tribeMates)
 
-    endTime = time.time()
+    endTime = time.monotonic()
 
     if endTime - startTime > 30:
         print("\n⏰ Time's up! You failed the challenge!")
@@ -461,6 +547,24 @@ def dailyChallenge(player, tribeMates, eliminatedTribeMates, roundNumber):
 
 # Section 5 - Tribal Council
 
+def castVote(candidates, voterIndex):
+    """
+    Picks a random tribe member for a voter to vote out, never the voter
+    themselves. Skips the voter's own slot instead of building a filtered list.
+
+    Parameters:
+        candidates (tuple): Names of the tribe members who can be voted out.
+        voterIndex (int): Position of the voting tribe member in candidates.
+
+    Returns:
+        str: The name of the tribe member voted against.
+    """
+    pick = random.randrange(len(candidates) - 1)
+    if pick >= voterIndex:
+        pick += 1
+    return candidates[pick]
+
+
 def tribalCouncil(player, tribeMates):
     """
     Initializes tribal council, where one tribe member is eliminated by majority vote.
@@ -477,12 +581,14 @@ def tribalCouncil(player, tribeMates):
         tuple: Updated list of tribe members and a boolean indicating if the
         player was eliminated (True or False).
     """
+    validNames = tuple(mate["name"] for mate in tribeMates)
+
     print("\n🔥 Tribal Council 🔥")
     print("Welcome to tribal council! Who will be voted out tonight?\n")
 
     print("Tribe members who can be voted out (excluding yourself):")
-    for mate in tribeMates:
-        print(f"🔹 {mate['name']}\n")
+    for name in validNames:
+        print(f"🔹 {name}\n")
 
     print(f"⚡️{player['name']}'s Social Status: {player['socialStatus']}")
     print(f"🔅{player['name']}'s Health: {player['currentHealth']}\n")
@@ -492,8 +598,6 @@ def tribalCouncil(player, tribeMates):
         if random.choice([True, False]):  # 50% elimination chance
             print(f"🚨 {player['name']} has been eliminated! The tribe has spoken.")
             return None, True
-
-    validNames = [mate["name"] for mate in tribeMates]
     while True:
         playerVote = input(f"📜 Enter the name of a tribe member to vote out  "
                             f"({', '.join(validNames)}): ").strip()
@@ -501,30 +605,58 @@ def tribalCouncil(player, tribeMates):
             break
         print("❌ Invalid choice. Please enter a valid name from the list.")
 
-    votes = {name: 0 for name in validNames + [player["name"]]}
+    votes = Counter()
 
     # Player's vote is counted, with higher weight if social status is high.
     voteWeight = 2 if player["socialStatus"] > 75 else 1
     votes[playerVote] += voteWeight
 
-    # Tribe members cast their votes for each other (randomly).
-    for mate in tribeMates:
-        otherCandidates = [name for name in validNames if name != mate["name"]]
-        votes[random.choice(otherCandidates)] += 1
+    # Tribe members cast their votes for each other (randomly). Tribe mate i
+    # is validNames[i], so every voter shares the same tuple of names.
+    # Reading stops once the leader can't be caught by the votes left,
+    # including the up-to-3 extra votes a low-status player can still get.
+    leader, leaderCount, secondCount = playerVote, voteWeight, 0
+    extraSlack = 3 if player["socialStatus"] < 30 else 0
+    numVoters = len(validNames)
+    for voterIndex in range(numVoters):
+        vote = castVote(validNames, voterIndex)
+        votes[vote] += 1
+        count = votes[vote]
+        if vote == leader:
+            leaderCount = count
+        elif count > leaderCount:
+            leader, leaderCount, secondCount = vote, count, leaderCount
+        elif count > secondCount:
+            secondCount = count
+
+        remaining = numVoters - voterIndex - 1
+        slack = remaining + (extraSlack if leader != player["name"] else 0)
+        if remaining and leaderCount > secondCount + slack:
+            print("🗳️ That's enough votes. The rest will not be read.")
+            break
 
     # If the player's social status is low (< 30), they are more vulnerable.
     if player["socialStatus"] < 30:
         extraVotes = random.randint(1, 3)
         votes[player["name"]] += extraVotes
 
-    maxVotes = max(votes.values())
-    eliminatedCandidates = [name for name, count in votes.items() if
-                             count == maxVotes]
+    # One ordering serves both the tie check and the printed tally. It is
+    # sorted by count, so the tied leaders are a prefix of it.
+    ordered = votes.most_common()
+    maxVotes = ordered[0][1]
+    eliminatedCandidates = []
+    for name, count in ordered:
+        if count < maxVotes:
+            break
+        eliminatedCandidates.append(name)
 
     # If there's a tie, randomly eliminate one tribe mate from the highest votes.
-    eliminated = random.choice(eliminatedCandidates)
+    if len(eliminatedCandidates) > 1:
+        eliminated = random.choice(eliminatedCandidates)
+    else:
+        eliminated = eliminatedCandidates[0]
 
-    for name, count in sorted(votes.items(), key=lambda item: -item[1]):
+    for name, count in ordered:
         print(f"   {name}: {count} vote(s)")
 
     if eliminated == player["name"]:
@@ -539,6 +671,54 @@ def tribalCouncil(player, tribeMates):
 
 
 # Section 6 - Final Tribal Council and Ending the Game
+
+def readPauseScale():
+    """
+    Reads the multiplier for the dramatic pauses from the environment.
+    SURVIVOR_FAST or SURVIVOR_PAUSE=0 skips them entirely; a value that is not
+    a finite number falls back to normal pace, and a negative one counts as 0.
+
+    Returns:
+        float: The pause multiplier, never negative.
+    """
+    if os.environ.get("SURVIVOR_FAST"):
+        return 0.0
+    try:
+        scale = float(os.environ.get("SURVIVOR_PAUSE", "1.0"))
+    except ValueError:
+        return 1.0
+    if not math.isfinite(scale):
+        return 1.0
+    return max(0.0, scale)
+
+
+PAUSE_SCALE = readPauseScale()
+
+# Answers the player can give the jury, in menu order.
+FINAL_ARGUMENTS = (
+    "I will use it to support my family.",
+    "I will use it to chase a dream.",
+    "I will use it for whatever I want - it's my money."
+)
+
+# Menu entries accepted at Final Tribal Council.
+FINAL_CHOICES = frozenset({"1", "2", "3"})
+
+
+def pause(seconds):
+    """
+    Waits for a dramatic pause, scaled by PAUSE_SCALE.
+
+    Parameters:
+        seconds (float): Length of the pause at normal pace.
+
+    Returns:
+        None
+    """
+    if PAUSE_SCALE:
+        time.sleep(seconds * PAUSE_SCALE)
+
+
 def finalTribalCouncil(player, opponent, jury):
     """
     Launches Final Tribal Council where the jury votes for the Sole Survivor. There
@@ -560,29 +740,23 @@ def finalTribalCouncil(player, opponent, jury):
 
     while True:
         finalCase = input("\n💡 Select your answer (1, 2, or 3): ").strip()
-        if finalCase in ["1", "2", "3"]:
+        if finalCase in FINAL_CHOICES:
             break
         print("❌ Invalid choice! Please enter 1, 2, or 3.")
 
-    arguments = {
-        "1": "I will use it to support my family.",
-        "2": "I will use it to chase a dream.",
-        "3": "I will use it for whatever I want - it's my money."
-    }
-
-    userResponse = arguments[finalCase]
+    userResponse = FINAL_ARGUMENTS[int(finalCase) - 1]
     print(f"\n💬 You respond: \"{userResponse}\"")
 
     print("\n🤔 The jury is deliberating...")
-    time.sleep(3)
+    pause(3)
     print("🗳️ The votes are being cast...")
-    time.sleep(2)
+    pause(2)
 
     # Jury randomly determines if they approve or not.
     juryApproval = random.choice(["approve", "disapprove"])
 
     print("\n📜 The final vote result is being revealed...")
-    time.sleep(3)
+    pause(3)
 
     if juryApproval == "approve":
         print("\n🌟 The jury nods and says: \"Have a beautiful life.\"")
@@ -593,7 +767,7 @@ def finalTribalCouncil(player, opponent, jury):
             "money!\"")
         winner = opponent["name"]
 
-    time.sleep(2)
+    pause(2)
     if winner == player["name"]:
         print(f"\n🥇**CONGRATULATIONS! You earned every jury vote!** 🎉")
         print(
@@ -608,6 +782,166 @@ def finalTribalCouncil(player, opponent, jury):
 
 
 # Section 7 - Main Game Loop
+
+# Results an action handler returns to mainGameLoop; None keeps the day going.
+END_DAY = "endDay"
+EXIT = "exit"
+ELIMINATED = "eliminated"
+
+HELP_MENU = (
+    "\n📜 Menu:\n"
+    "- 💤 rest: Recover health.\n"
+    "- 🔍 explore: Search for the Hidden Immunity Idol.\n"
+    "- ⚔️ challenge: Compete in an immunity challenge.\n"
+    "- 📊 status: View your current health and social status.\n"
+    "- 🚪 exit: Quit the game.\n")
+
+
+def helpAction(player, tribeMates, actionsPerformed, eliminatedTribeMates, day):
+    """
+    Shows the list of daily actions.
+
+    Parameters:
+        player (dict): The player's character and stats.
+        tribeMates (list): Remaining tribe members.
+        actionsPerformed (dict): Which once-a-day actions were taken today.
+        eliminatedTribeMates (list): Tribe members voted out so far.
+        day (int): The current day.
+
+    Returns:
+        None
+    """
+    sys.stdout.write(HELP_MENU)
+
+
+def exitAction(player, tribeMates, actionsPerformed, eliminatedTribeMates, day):
+    """
+    Quits the game.
+
+    Parameters:
+        player (dict): The player's character and stats.
+        tribeMates (list): Remaining tribe members.
+        actionsPerformed (dict): Which once-a-day actions were taken today.
+        eliminatedTribeMates (list): Tribe members voted out so far.
+        day (int): The current day.
+
+    Returns:
+        str: EXIT.
+    """
+    print("\n👋 You have exited the game. Thanks for playing!")
+    return EXIT
+
+
+def restAction(player, tribeMates, actionsPerformed, eliminatedTribeMates, day):
+    """
+    Recovers some health at the cost of social status, once per day.
+
+    Parameters:
+        player (dict): The player's character and stats.
+        tribeMates (list): Remaining tribe members.
+        actionsPerformed (dict): Which once-a-day actions were taken today.
+        eliminatedTribeMates (list): Tribe members voted out so far.
+        day (int): The current day.
+
+    Returns:
+        str: END_DAY.
+    """
+    if actionsPerformed["rest"]:
+        print("You've already rested today. Choose another action")
+    else:
+        maxHealth = player["maxHealth"]
+        currentHealth = min(player["currentHealth"] + 5, maxHealth)
+        socialStatus = max(0, player["socialStatus"] - 25)
+        player["currentHealth"] = currentHealth
+        player["socialStatus"] = socialStatus
+        sys.stdout.write(
+            f"😴 You take time to rest and recover health.\n"
+            f"📉 Your social status has decreased to {socialStatus}.\n"
+            f"🥱 Your health is now {currentHealth}/{maxHealth}.\n\n")
+        actionsPerformed["rest"] = True
+    return END_DAY
+
+
+def exploreAction(player, tribeMates, actionsPerformed, eliminatedTribeMates, day):
+    """
+    Explores the island, once per day.
+
+    Parameters:
+        player (dict): The player's character and stats.
+        tribeMates (list): Remaining tribe members.
+        actionsPerformed (dict): Which once-a-day actions were taken today.
+        eliminatedTribeMates (list): Tribe members voted out so far.
+        day (int): The current day.
+
+    Returns:
+        str: END_DAY.
+    """
+    if actionsPerformed["explore"]:
+        print("You've already explored today. Choose another action")
+    else:
+        exploreIsland(player)
+        actionsPerformed["explore"] = True
+    return END_DAY
+
+
+def challengeAction(player, tribeMates, actionsPerformed, eliminatedTribeMates,
+                    day):
+    """
+    Runs the day's immunity challenge. Unless the player is voted out, the
+    contents of tribeMates are replaced in place with the tribe left after
+    any Tribal Council; this is how mainGameLoop's tribe list is updated.
+
+    Parameters:
+        player (dict): The player's character and stats.
+        tribeMates (list): Remaining tribe members; mutated in place.
+        actionsPerformed (dict): Which once-a-day actions were taken today.
+        eliminatedTribeMates (list): Tribe members voted out so far.
+        day (int): The current day.
+
+    Returns:
+        str: ELIMINATED if the player was voted out, otherwise END_DAY.
+    """
+    updatedTribeMates, eliminated = dailyChallenge(player, tribeMates,
+                                                   eliminatedTribeMates, day)
+    if eliminated:
+        return ELIMINATED
+    tribeMates[:] = updatedTribeMates
+    return END_DAY
+
+
+def statusAction(player, tribeMates, actionsPerformed, eliminatedTribeMates, day):
+    """
+    Shows the player's current health and social status.
+
+    Parameters:
+        player (dict): The player's character and stats.
+        tribeMates (list): Remaining tribe members.
+        actionsPerformed (dict): Which once-a-day actions were taken today.
+        eliminatedTribeMates (list): Tribe members voted out so far.
+        day (int): The current day.
+
+    Returns:
+        None
+    """
+    sys.stdout.write(
+        f"\n📊 Current Status:\n"
+        f"⚡️ Health: {player['currentHealth']} / {player['maxHealth']}\n"
+        f"📈 Social Status: {player['socialStatus']}\n\n")
+
+
+# Daily actions by command, looked up once per prompt. Every handler takes
+# (player, tribeMates, actionsPerformed, eliminatedTribeMates, day) and returns
+# END_DAY, EXIT, ELIMINATED, or None to keep prompting.
+ACTION_HANDLERS = {
+    "help": helpAction,
+    "exit": exitAction,
+    "rest": restAction,
+    "explore": exploreAction,
+    "challenge": challengeAction,
+    "status": statusAction
+}
+
+
 def mainGameLoop():
     """
     Runs the main Survivor RPG game loop - the "game brain".
@@ -624,10 +958,7 @@ def mainGameLoop():
 
     print("Choose your Survivor contestant:")
     # Display of available characters with their attributes and flaws.
-    for name, details in CHARACTERS.items():
-        print(f"\n🔹 {name}")
-        print(f"   🏅 Attributes: {', '.join(details['attributes'])}")
-        print(f"   😈️ Flaws: {', '.join(details['flaws'])}")
+    print(CHARACTER_MENU_STR)
 
     # User input for character selection.
     while True:
@@ -647,20 +978,22 @@ def mainGameLoop():
     print(f"\n🌟 You're playing as {playerName}! Meet your tribe members:\n")
     input("Press Enter to continue...")
 
-    for mate in tribeMates:
-        print(f"🔹 {mate['name']}")
-        print(f"😇 Attributes: {', '.join(mate['attributes'])}")
-        print(f"😈 Flaws: {', '.join(mate['flaws'])}\n")
+    sys.stdout.write("".join(
+        f"🔹 {mate['name']}\n"
+        f"😇 Attributes: {', '.join(mate['attributes'])}\n"
+        f"😈 Flaws: {', '.join(mate['flaws'])}\n\n"
+        for mate in tribeMates))
 
     input("Press Enter to continue...")
 
     # Display Player Stats.
-    print("\n📊 Your Stats:")
-    print(f"🏥 Health: {player['currentHealth']} / {player['maxHealth']}")
-    print(f"📈 Social Status: {player['socialStatus']}")
-    print(f"📝 Attributes: {', '.join(player['attributes'])}")
-    print(f"😈️ Flaws: {', '.join(player['flaws'])}\n")
-    print("\n🎉 Let's see if you can outwit, outplay, and outlast!\n")
+    sys.stdout.write(
+        f"\n📊 Your Stats:\n"
+        f"🏥 Health: {player['currentHealth']} / {player['maxHealth']}\n"
+        f"📈 Social Status: {player['socialStatus']}\n"
+        f"📝 Attributes: {', '.join(player['attributes'])}\n"
+        f"😈️ Flaws: {', '.join(player['flaws'])}\n\n"
+        "\n🎉 Let's see if you can outwit, outplay, and outlast!\n\n")
 
     day = 1
     while len(tribeMates) > 1:
@@ -675,58 +1008,19 @@ def mainGameLoop():
                 "Enter an action (rest, explore, challenge, status, exit): "
                 "").strip().lower()
 
-            if action == "help":
-                print("\n📜 Menu:")
-                print("- 💤 rest: Recover health.")
-                print("- 🔍 explore: Search for the Hidden Immunity Idol.")
-                print("- ⚔️ challenge: Compete in an immunity challenge.")
-                print("- 📊 status: View your current health and social status.")
-                print("- 🚪 exit: Quit the game.")
-
-            elif action == "exit":
-                print("\n👋 You have exited the game. Thanks for playing!")
-                return "Game Over: You didn't survive!"
-
-            elif action == "rest":
-                if actionsPerformed["rest"]:
-                    print("You've already rested today. Choose another action")
-                else:
-                    print("😴 You take time to rest and recover health.")
-                    player["currentHealth"] = min(player["currentHealth"] + 5, player
-                    ["maxHealth"])
-                    player["socialStatus"] = max(0, player["socialStatus"] - 25)
-                    print(
-                        f"📉 Your social status has decreased to "
-                        f"{player['socialStatus']}.")
-                    print(f"🥱 Your health is now {player['currentHealth']}/"
-                          f"{player['maxHealth']}.\n")
-                    actionsPerformed["rest"] = True
-                break
-
-            elif action == "explore":
-                if actionsPerformed["explore"]:
-                    print("You've already explored today. Choose another action")
-                else:
-                    exploreIsland(player)
-                    actionsPerformed["explore"] = True
-                break
-
-            elif action == "challenge":
-                tribeMates, eliminated = dailyChallenge(player, tribeMates,
-                                                        eliminatedTribeMates, day)
-
-                if eliminated:
-                    return "Game Over: You've been voted off the Island!"
+            handler = ACTION_HANDLERS.get(action)
+            if handler is None:
+                print("❌ Invalid command. Type 'help' for options.")
+                continue
 
+            result = handler(player, tribeMates, actionsPerformed,
+                             eliminatedTribeMates, day)
+            if result == END_DAY:
                 break
-
-            elif action == "status":
-                print("\n📊 Current Status:")
-                print(f"⚡️ Health: {player['currentHealth']} / {player['maxHealth']}")
-                print(f"📈 Social Status: {player['socialStatus']}\n")
-
-            else:
-                print("❌ Invalid command. Type 'help' for options.")
+            if result == EXIT:
+                return "Game Over: You didn't survive!"
+            if result == ELIMINATED:
+                return "Game Over: You've been voted off the Island!"
 
         day += 1
 
@@ -754,28 +1048,30 @@ def exploreIsland(player):
     outcome = random.choice(["findIdol", "caught", "nothing", "buildAlliance"])
 
     if outcome == "findIdol":
-        print("🎉 Congratulations! You found a Hidden Immunity Idol.")
         player["inventory"].append("Hidden Immunity Idol")
         player["currentHealth"] = player["maxHealth"]
-        print("💪 Your health is fully restored!")
+        sys.stdout.write("🎉 Congratulations! You found a Hidden Immunity Idol.\n"
+                         "💪 Your health is fully restored!\n")
 
     elif outcome == "caught":
-        print("😳Oh no! You were caught searching for an idol.")
         player["socialStatus"] -= 20
-        print("📉 Your social status decreases by 20.")
+        sys.stdout.write("😳Oh no! You were caught searching for an idol.\n"
+                         "📉 Your social status decreases by 20.\n")
 
     elif outcome == "buildAlliance":
-        print("🤝 You encounter another tribe member while exploring.")
-        print("After spending time together, you decide to form an alliance!")
         player["socialStatus"] += 10
-        print("📈Your social status increases by 10.")
+        sys.stdout.write(
+            "🤝 You encounter another tribe member while exploring.\n"
+            "After spending time together, you decide to form an alliance!\n"
+            "📈Your social status increases by 10.\n")
 
     else:
-        print("🕵 You searched for hours, got sunburned, and found nothing.")
-        player["currentHealth"] -= 10
-        print(
+        currentHealth = player["currentHealth"] - 10
+        player["currentHealth"] = currentHealth
+        sys.stdout.write(
+            f"🕵 You searched for hours, got sunburned, and found nothing.\n"
             f"👎 You lost 10 health points. Current health: "
-            f"{player['currentHealth']}/{player['maxHealth']}\n")
+            f"{currentHealth}/{player['maxHealth']}\n\n")
 
     input("Press Enter to continue...")
 